@@ -6,10 +6,30 @@ This module provides a simple web interface for loading and processing CSV data
 using Streamlit framework.
 """
 
+import os
+
 import streamlit as st
 import pandas as pd
-from modules.data_loader import load_data
-from modules.data_processor import process_data
+from modules.fast_pipeline import load_and_process_arrow
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _cached_load(file_path, mtime):
+    """
+    Load and process a CSV file once per (path, modification time) pair.
+    
+    The result is shared by every session without being hashed or copied,
+    which is safe because Arrow tables are immutable.
+    
+    Args:
+        file_path (str): Path to the CSV file.
+        mtime (float): Modification time of the file. Only used as part of
+            the cache key so that editing the file invalidates the entry.
+    
+    Returns:
+        pyarrow.Table: The processed data.
+    """
+    return load_and_process_arrow(file_path)
 
 
 def main():
@@ -27,11 +47,12 @@ def main():
     """
     st.title("Streamlit Demo with Repeated Modules")
     
-    data = load_data('data/data.csv')
-    processed_data = process_data(data)
+    file_path = 'data/data.csv'
+    table = _cached_load(file_path, os.path.getmtime(file_path))
+    processed_data = table.to_pandas(types_mapper=pd.ArrowDtype)
     
     st.write("Processed Data:")
-    st.write(processed_data)
+    st.dataframe(processed_data)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,2 @@
+# Having a conftest.py at the repository root puts the root on sys.path, so
+# tests can import the modules package with a plain `pytest` run.
@@ -0,0 +1,33 @@
+import numpy as np
+
+from modules._kernels import bump_ages
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# Below this size the compiled kernels' dispatch cost outweighs their gain.
+COMPILED_MIN_ROWS = 10_000
+
+def _bump(ages, threshold):
+    if len(ages) >= COMPILED_MIN_ROWS and ages.dtype.kind in 'iuf':
+        if bump_ages is not None:
+            return bump_ages(ages, threshold)
+        if ne is not None:
+            # NumExpr computes small and unsigned ints as int32/int64.
+            bumped = ne.evaluate(
+                'where(a > t, a + 1, a)', local_dict={'a': ages, 't': threshold}
+            )
+            return bumped.astype(ages.dtype, copy=False)
+    return np.where(ages > threshold, ages + 1, ages)
+
+def bump_age(df, threshold=18):
+    # Drop missing ages first so the bump only touches rows that are kept.
+    present = df['age'].notna().to_numpy()
+    if not present.all():
+        df = df[present]
+    # Always return a new frame; the caller's frame is never modified.
+    df = df.copy(deep=False)
+    df['age'] = _bump(df['age'].to_numpy(), threshold)
+    return df
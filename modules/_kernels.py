@@ -0,0 +1,16 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def bump_ages(ages, threshold):
+        out = np.empty_like(ages)
+        for i in prange(ages.shape[0]):
+            out[i] = ages[i] + 1 if ages[i] > threshold else ages[i]
+        return out
+else:
+    bump_ages = None
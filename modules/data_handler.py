@@ -1,7 +1,6 @@
 import pandas as pd
 
+from modules._age_ops import bump_age
+
 def handle_dataset(path):
-    df = pd.read_csv(path)
-    df['age'] = df['age'].apply(lambda x: x + 1 if x > 18 else x)
-    df = df.dropna(subset=['age'])
-    return df
+    return bump_age(pd.read_csv(path))
@@ -1,4 +1,6 @@
 import pandas as pd
 
 def load_data(file_path):
-    return pd.read_csv(file_path)
+    # Unlike the C engine, pyarrow parses ISO dates into datetime.date objects
+    # and types the columns of a header-only file as float64 rather than object.
+    return pd.read_csv(file_path, engine='pyarrow')
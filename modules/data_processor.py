@@ -1,3 +1,14 @@
+import pandas as pd
+
+# Roughly 64 MiB per chunk for narrow frames like data/data.csv.
+CHUNK_ROWS = 2 ** 19
+
 def process_data(data):
-    data['age'] = data['age'] + 1
-    return data
+    processed_data = data.copy(deep=False)
+    processed_data['age'] = data['age'] + 1
+    return processed_data
+
+def process_data_streaming(file_path, chunksize=CHUNK_ROWS):
+    reader = pd.read_csv(file_path, chunksize=chunksize, engine='c', memory_map=True)
+    chunks = [process_data(chunk) for chunk in reader]
+    return pd.concat(chunks, ignore_index=True)
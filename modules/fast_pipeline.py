@@ -0,0 +1,12 @@
+import pandas as pd
+import polars as pl
+
+def load_and_process_arrow(file_path):
+    # Pinning age to Float64 keeps decimals, missing values and header-only
+    # files working without polars inferring the type from the first rows.
+    plan = pl.scan_csv(file_path, schema_overrides={'age': pl.Float64})
+    frame = plan.with_columns(pl.col('age') + 1).collect()
+    return frame.to_arrow(compat_level=pl.CompatLevel.oldest())
+
+def load_and_process(file_path):
+    return load_and_process_arrow(file_path).to_pandas(types_mapper=pd.ArrowDtype)
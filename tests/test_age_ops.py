@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules import _age_ops
+from modules._age_ops import COMPILED_MIN_ROWS, _bump, bump_age
+
+DTYPES = ['int8', 'uint8', 'int16', 'int64', 'uint64', 'float32', 'float64']
+
+
+def _ages(dtype):
+    ages = (np.arange(COMPILED_MIN_ROWS) % 100).astype(dtype)
+    if ages.dtype.kind == 'f':
+        ages[::7] = np.nan
+    return ages
+
+
+def _expected(ages):
+    return np.where(ages > 18, ages + 1, ages)
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_numpy_path(monkeypatch, dtype):
+    monkeypatch.setattr(_age_ops, 'bump_ages', None)
+    monkeypatch.setattr(_age_ops, 'ne', None)
+    ages = _ages(dtype)
+    result = _bump(ages, 18)
+    assert result.dtype == ages.dtype
+    np.testing.assert_array_equal(result, _expected(ages))
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_numexpr_path(monkeypatch, dtype):
+    ne = pytest.importorskip('numexpr')
+    monkeypatch.setattr(_age_ops, 'bump_ages', None)
+    monkeypatch.setattr(_age_ops, 'ne', ne)
+    ages = _ages(dtype)
+    result = _bump(ages, 18)
+    assert result.dtype == ages.dtype
+    np.testing.assert_array_equal(result, _expected(ages))
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_numba_path(monkeypatch, dtype):
+    pytest.importorskip('numba')
+    from modules._kernels import bump_ages
+    monkeypatch.setattr(_age_ops, 'bump_ages', bump_ages)
+    ages = _ages(dtype)
+    result = _bump(ages, 18)
+    assert result.dtype == ages.dtype
+    np.testing.assert_array_equal(result, _expected(ages))
+
+
+@pytest.mark.parametrize('ages, expected', [
+    ([30.0, 10.0], [31.0, 10.0]),
+    ([30.0, np.nan], [31.0]),
+])
+def test_bump_age_leaves_input_untouched(ages, expected):
+    df = pd.DataFrame({'age': ages})
+    result = bump_age(df)
+    assert result is not df
+    assert df['age'].tolist() == pytest.approx(ages, nan_ok=True)
+    assert result['age'].tolist() == expected
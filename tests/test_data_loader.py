@@ -0,0 +1,29 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from modules.data_loader import load_data
+from modules.data_processor import process_data, process_data_streaming
+
+
+@pytest.mark.parametrize('ages, expected', [
+    ('30\n25', [31, 26]),
+    ('127\n30', [128, 31]),
+    ('200\n999', [201, 1000]),
+    ('30.5\n25', [31.5, 26.0]),
+])
+def test_ages_are_never_rewritten(tmp_path, ages, expected):
+    path = tmp_path / 'data.csv'
+    path.write_text('age\n' + ages + '\n')
+    assert list(process_data(load_data(path))['age']) == expected
+    assert list(process_data_streaming(path)['age']) == expected
+
+
+@pytest.mark.parametrize('dtype, ages, expected', [
+    ('Int64', [30, None], [31, None]),
+    ('Int8', [30, 25], [31, 26]),
+    (pd.ArrowDtype(pa.int64()), [30, None], [31, None]),
+])
+def test_process_data_extension_dtypes(dtype, ages, expected):
+    result = process_data(pd.DataFrame({'age': pd.array(ages, dtype=dtype)}))
+    assert [None if pd.isna(age) else age for age in result['age']] == expected
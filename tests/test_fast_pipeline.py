@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip('polars')
+
+from modules.fast_pipeline import load_and_process
+
+
+@pytest.mark.parametrize('rows, expected', [
+    ('a,30\nb,25\n', [31.0, 26.0]),
+    ('a,30.5\nb,25\n', [31.5, 26.0]),
+    ('a,\nb,\n', [None, None]),
+    ('', []),
+    ('a,30\n' * 150 + 'b,30.5\n', [31.0] * 150 + [31.5]),
+    ('a,\n' * 150 + 'b,30.5\n', [None] * 150 + [31.5]),
+])
+def test_load_and_process(tmp_path, rows, expected):
+    path = tmp_path / 'data.csv'
+    path.write_text('name,age\n' + rows)
+    ages = load_and_process(path)['age']
+    assert [None if pd.isna(age) else age for age in ages] == expected